@@ -1,21 +1,37 @@
-from rich.console import Console
-
-console = Console()
-
-with console.status(
-    "[bold green]Initializing AI conversation framework, please wait...", spinner="dots"
-) as status:
-    from autogen.agentchat.contrib.multimodal_conversable_agent import (
-        MultimodalConversableAgent,
-    )
-    import autogen
-    import json
-    import os
-    from typing import TypedDict, get_type_hints, List, Dict, Any, Callable, Union
-    from utils import prompt_utils, http_utils
-    from config import config
-    from clients.oai_llama_online import CitationEnabledOpenAIClient
-    from clients.reasoning_models import ReasoningEnabledOpenAIClient
+from __future__ import annotations
+
+import functools
+from typing import (
+    TypedDict,
+    get_type_hints,
+    List,
+    Dict,
+    Any,
+    Callable,
+    Union,
+)
+from utils import prompt_utils, litellm_probe
+from utils.lazy_import import lazy_import, load, prefetch
+from config import model_index
+
+# autogen takes seconds to import, it is loaded on first use so that applications
+# can show their first prompt right away, while it is prefetched in the background
+autogen = lazy_import(
+    'autogen',
+    status="[bold green]Initializing AI conversation framework, please wait...",
+)
+multimodal_conversable_agent = lazy_import(
+    'autogen.agentchat.contrib.multimodal_conversable_agent'
+)
+custom_clients = {
+    'CitationEnabledOpenAIClient': lazy_import('clients.oai_llama_online'),
+    'ReasoningEnabledOpenAIClient': lazy_import('clients.reasoning_models'),
+}
+prefetch(
+    'autogen',
+    multimodal_conversable_agent.__name__,
+    *[module.__name__ for module in custom_clients.values()],
+)
 
 DEFAULT_FILE_LOCATION = '.'
 DEFAULT_REQUEST_TIMEOUT = 300
@@ -23,28 +39,20 @@ DEFAULT_SEED = 42
 DEFAULT_TEMPERATURE = 0
 REASONING_MODELS = ['deepseek-r1', 'o3-mini', 'o1-preview', 'o3']
 
-os.environ["llms_config"] = json.dumps(config.get_llms_config())
 
-
-def get_llms_config_lists(models: List[Dict[str, Any]]):
-    return autogen.config_list_from_json(
-        env_or_file='llms_config',
-        filter_dict={
-            "model": models,
-        },
-    )
+def get_llms_config_lists(models: List[str]):
+    return model_index.get_model_index().where(model=models)
 
 
 def get_llm_config(
-    configs: Union[autogen.LLMConfig, dict[str, Any]], custom_config=None
+    configs: Union[autogen.LLMConfig, List[Dict[str, Any]]], custom_config=None
 ):
     default_config = {
         "timeout": DEFAULT_REQUEST_TIMEOUT,
         "cache_seed": DEFAULT_SEED,  # used for caching queries
         "temperature": DEFAULT_TEMPERATURE,
-        "config_list": configs.config_list
-        if isinstance(configs, autogen.LLMConfig)
-        else configs,
+        # checking for a list first avoids importing autogen when resolving Configs entries
+        "config_list": configs if isinstance(configs, list) else configs.config_list,
     }
 
     if custom_config is not None:
@@ -52,105 +60,170 @@ def get_llm_config(
     return default_config
 
 
-# if LiteLLM server is started, route all traffic through that proxy server
-openai_model_prefix = 'openai/' if http_utils.is_litellm_server_running() else ''
+def get_openai_model_prefix() -> str:
+    # if LiteLLM server is started, route all traffic through that proxy server
+    return 'openai/' if litellm_probe.is_litellm_proxy_running() else ''
+
+
+class LazyLLMConfig:
+    """A `Configs` entry which is only resolved on first attribute access.
+
+    Filtering the config list and building the llm config for every model
+    at import time is wasted work since an application only uses a few of
+    them. The resolved config is memoized per routing (proxy or direct), so
+    every later access returns the same dict until the routing changes.
+    """
+
+    def __init__(
+        self, model: str, custom_config=None, openai_routed: bool = False
+    ) -> None:
+        self.model = model
+        self.custom_config = custom_config
+        # openai models are prefixed when traffic is routed through the LiteLLM proxy
+        self.openai_routed = openai_routed
+        self._resolved: Dict[str, Dict[str, Any]] = {}
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None) -> Dict[str, Any]:
+        model = (
+            f"{get_openai_model_prefix()}{self.model}"
+            if self.openai_routed
+            else self.model
+        )
+        if model not in self._resolved:
+            self._resolved[model] = get_llm_config(
+                model_index.get_model_index().where(model=model), self.custom_config
+            )
+        return self._resolved[model]
+
+    def invalidate(self) -> None:
+        """Drop the memoized configs so the next access resolves them again."""
+        self._resolved.clear()
 
 
 class Configs:
-    configs = autogen.LLMConfig.from_json(env="llms_config")
-    gpt_5: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}gpt-5")
-    )
-    gemini_25_pro: Dict[str, Any] = get_llm_config(
-        configs.where(model="openrouter/gemini-2.5-pro")
-    )
-    claude_4_sonnet: Dict[str, Any] = get_llm_config(
-        configs.where(model="anthropic/claude-sonnet-4")
-    )
-    or_gpt_5: Dict[str, Any] = get_llm_config(configs.where(model="openrouter/gpt-5"))
-    claude_4_sonnet_thinking: Dict[str, Any] = get_llm_config(
-        configs=configs.where(model="anthropic/claude-sonnet-4-thinking"),
+    gpt_5: Dict[str, Any] = LazyLLMConfig("gpt-5", openai_routed=True)
+    gemini_25_pro: Dict[str, Any] = LazyLLMConfig("openrouter/gemini-2.5-pro")
+    claude_4_sonnet: Dict[str, Any] = LazyLLMConfig("anthropic/claude-sonnet-4")
+    or_gpt_5: Dict[str, Any] = LazyLLMConfig("openrouter/gpt-5")
+    claude_4_sonnet_thinking: Dict[str, Any] = LazyLLMConfig(
+        "anthropic/claude-sonnet-4-thinking",
         # anthropic requires specific params for thinking models
         custom_config={"temperature": 1},
     )
-    gpt_41: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}gpt-41")
-    )
-    o4_mini: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}o4-mini")
-    )
-    gpt_5_mini: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}gpt-5-mini")
-    )
-    o3: Dict[str, Any] = get_llm_config(configs.where(model=f"{openai_model_prefix}o3"))
-    chatgpt_4o_latest: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}chatgpt-4o-latest")
-    )
-    gemini_25_flash: Dict[str, Any] = get_llm_config(
-        configs.where(model="openrouter/gemini-2.5-flash")
-    )
-    kimi_k2: Dict[str, Any] = get_llm_config(configs.where(model="openrouter/kimi-k2"))
-    gemini_2_flash: Dict[str, Any] = get_llm_config(
-        configs.where(model="openrouter/gemini-2.0-flash")
+    gpt_41: Dict[str, Any] = LazyLLMConfig("gpt-41", openai_routed=True)
+    o4_mini: Dict[str, Any] = LazyLLMConfig("o4-mini", openai_routed=True)
+    gpt_5_mini: Dict[str, Any] = LazyLLMConfig("gpt-5-mini", openai_routed=True)
+    o3: Dict[str, Any] = LazyLLMConfig("o3", openai_routed=True)
+    chatgpt_4o_latest: Dict[str, Any] = LazyLLMConfig(
+        "chatgpt-4o-latest", openai_routed=True
     )
-    claude_37_sonnet: Dict[str, Any] = get_llm_config(
-        configs.where(model="anthropic/claude-3.7-sonnet")
+    gemini_25_flash: Dict[str, Any] = LazyLLMConfig("openrouter/gemini-2.5-flash")
+    kimi_k2: Dict[str, Any] = LazyLLMConfig("openrouter/kimi-k2")
+    gemini_2_flash: Dict[str, Any] = LazyLLMConfig("openrouter/gemini-2.0-flash")
+    claude_37_sonnet: Dict[str, Any] = LazyLLMConfig("anthropic/claude-3.7-sonnet")
+    claude_37_thinking: Dict[str, Any] = LazyLLMConfig("openrouter/claude-3.7-thinking")
+    claude_35_sonnet: Dict[str, Any] = LazyLLMConfig("anthropic/claude-3.5-sonnet")
+    deepseek_r1: Dict[str, Any] = LazyLLMConfig(
+        "deepseek/deepseek-r1", {"temperature": 0.6}
     )
-    claude_37_thinking: Dict[str, Any] = get_llm_config(
-        configs.where(model="openrouter/claude-3.7-thinking")
+    o3_mini: Dict[str, Any] = LazyLLMConfig("o3-mini", openai_routed=True)
+    sonar_r1: Dict[str, Any] = LazyLLMConfig("openrouter/sonar-r1")
+    deepseek_v3: Dict[str, Any] = LazyLLMConfig("deepseek/deepseek-v3")
+    gpt4_o1: Dict[str, Any] = LazyLLMConfig("o1-preview", openai_routed=True)
+    llama_31_sonar_online: Dict[str, Any] = LazyLLMConfig(
+        "openrouter/llama-3.1-sonar-large-online"
     )
-    claude_35_sonnet: Dict[str, Any] = get_llm_config(
-        configs.where(model="anthropic/claude-3.5-sonnet")
-    )
-    deepseek_r1: Dict[str, Any] = get_llm_config(
-        configs.where(model="deepseek/deepseek-r1"),
-        {"temperature": 0.6},
-    )
-    o3_mini: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}o3-mini")
-    )
-    sonar_r1: Dict[str, Any] = get_llm_config(
-        configs.where(model="openrouter/sonar-r1")
-    )
-    deepseek_v3: Dict[str, Any] = get_llm_config(
-        configs.where(model="deepseek/deepseek-v3")
-    )
-    gpt4_o1: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}o1-preview")
-    )
-    llama_31_sonar_online: Dict[str, Any] = get_llm_config(
-        configs.where(model="openrouter/llama-3.1-sonar-large-online")
-    )
-    gpt4_turbo: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}gpt-4-turbo-2024-04-09")
-    )
-    claude_35_haiku: Dict[str, Any] = get_llm_config(
-        configs.where(model="anthropic/claude-3.5-haiku")
-    )
-    gpt4o_mini: Dict[str, Any] = get_llm_config(
-        configs.where(model=f"{openai_model_prefix}gpt-4o-mini")
-    )
-    mistral_medium: Dict[str, Any] = get_llm_config(
-        configs.where(model="mistral/mistral-medium")
-    )
-    mistral_large: Dict[str, Any] = get_llm_config(
-        configs.where(model="mistral/mistral-large")
-    )
-    dalle: Dict[str, Any] = get_llm_config(configs.where(model="dall-e-3"))
-    codellama: Dict[str, Any] = get_llm_config(
-        configs.where(model="ollama/codellama:34b")
+    gpt4_turbo: Dict[str, Any] = LazyLLMConfig(
+        "gpt-4-turbo-2024-04-09", openai_routed=True
     )
+    claude_35_haiku: Dict[str, Any] = LazyLLMConfig("anthropic/claude-3.5-haiku")
+    gpt4o_mini: Dict[str, Any] = LazyLLMConfig("gpt-4o-mini", openai_routed=True)
+    mistral_medium: Dict[str, Any] = LazyLLMConfig("mistral/mistral-medium")
+    mistral_large: Dict[str, Any] = LazyLLMConfig("mistral/mistral-large")
+    dalle: Dict[str, Any] = LazyLLMConfig("dall-e-3")
+    codellama: Dict[str, Any] = LazyLLMConfig("ollama/codellama:34b")
 
 
 def get_config_options():
+    # type hints are used so that options are listed without resolving any entry
     return list(get_type_hints(Configs).keys())
 
 
+def get_rerouted_config_list(config_list, prefix: str):
+    """Map openai config entries to their proxy (prefixed) or direct
+    counterpart.
+
+    Entries which don't have a counterpart for the requested routing are
+    kept as they are.
+    """
+    index = model_index.get_model_index()
+    rerouted = []
+    for entry in config_list:
+        model = entry['model'].removeprefix('openai/')
+        is_openai_model = index.get(f"openai/{model}") is not None
+        counterpart = index.get(f"{prefix}{model}") if is_openai_model else None
+        rerouted.append(dict(counterpart.config) if counterpart else entry)
+    return rerouted
+
+
+def register_custom_model_client(agent: autogen.ConversableAgent):
+    agent_config = agent.llm_config.get("config_list", [{}])[0]
+    model_client_cls = agent_config.get("model_client_cls")
+    if model_client_cls:
+        agent.register_model_client(
+            model_client_cls=getattr(custom_clients[model_client_cls], model_client_cls)
+        )
+        # since we are using a hybrid client extending OpenAIClient which just overrides message_retrieval,
+        # after the new client is registered, the custom model_client_cls attribute must be removed
+        # otherwise OpenAIWrapper.create will throw an error because it can't handle model_client_cls
+        agent.client._config_list[0].pop('model_client_cls', None)
+    # autogen re-creates the client when tools are registered, keep track of the customized one
+    agent._customized_client = agent.client
+
+
+def refresh_agent_client(agent: autogen.ConversableAgent):
+    """Re-apply the client customizations when the client was re-created
+    and switch the agent between proxy and direct routing when the LiteLLM
+    proxy went up or down since the agent was created."""
+    if not agent.llm_config:
+        return
+    prefix = get_openai_model_prefix()
+    if getattr(agent, '_openai_model_prefix', prefix) != prefix:
+        llm_config = agent.llm_config.model_dump()
+        llm_config['config_list'] = get_rerouted_config_list(
+            llm_config['config_list'], prefix
+        )
+        agent.llm_config = autogen.LLMConfig(**llm_config)
+        agent.client = autogen.OpenAIWrapper(**agent.llm_config)
+    agent._openai_model_prefix = prefix
+    if getattr(agent, '_customized_client', None) is not agent.client:
+        register_custom_model_client(agent)
+
+
+def with_client_refresh(reply_func):
+    @functools.wraps(reply_func)
+    def wrapped_reply_func(self, *args, **kwargs):
+        refresh_agent_client(self)
+        return reply_func(self, *args, **kwargs)
+
+    return wrapped_reply_func
+
+
+# autogen.ConversableAgent is resolved on call so that autogen is imported lazily
+def _generate_oai_reply(self, *args, **kwargs):
+    return autogen.ConversableAgent.generate_oai_reply(self, *args, **kwargs)
+
+
 # setup autogen overrides
-generate_oai_reply_with_loading = prompt_utils.with_progress_bar(
-    description="Fetching LLM response..."
-)(autogen.ConversableAgent.generate_oai_reply)
-prompt_utils.set_custom_IO_overrides()
+generate_oai_reply = with_client_refresh(_generate_oai_reply)
+generate_oai_reply_with_loading = with_client_refresh(
+    prompt_utils.with_progress_bar(description="Fetching LLM response...")(
+        _generate_oai_reply
+    )
+)
 
 coder_system_message = """
 <prompt_explanation>
@@ -245,6 +318,9 @@ class AgentFactory:
     """
 
     def __init__(self):
+        # wait for autogen while showing the loading status, then setup the autogen overrides
+        load(autogen)
+        prompt_utils.set_custom_IO_overrides()
         self.factories: AgentFactoryMap = {
             'coder': lambda custom_config=None, custom_name=None, **kwargs: autogen.AssistantAgent(
                 name=custom_name or "expert_coder",
@@ -430,7 +506,7 @@ class AgentFactory:
                     Collaborates with development teams to ensure software quality throughout all stages of the software development lifecycle.
                     """,
             ),
-            'image_analyst': lambda *args, **kwargs: MultimodalConversableAgent(
+            'image_analyst': lambda *args, **kwargs: multimodal_conversable_agent.MultimodalConversableAgent(
                 name="image_analyst",
                 llm_config={**Configs.claude_37_sonnet, **{"temperature": 0.5}},
                 system_message="""
@@ -488,27 +564,17 @@ class AgentFactory:
     # extra initialization rules for agents
     def _init_agent(self, agent: autogen.AssistantAgent, **kwargs):
         agent_config = agent.llm_config.get("config_list", [{}])[0]
-        model_client_cls = agent_config.get("model_client_cls")
         model_name = agent_config.get("model")
         # by default, agents will show the loading animation while fetching the reply.
         # to disable this, create agents with the flag disabled
-        if kwargs.get('show_loading_animation', True):
-            agent.replace_reply_func(
-                old_reply_func=autogen.ConversableAgent.generate_oai_reply,
-                new_reply_func=generate_oai_reply_with_loading,
-            )
-        client_class_map = {
-            'CitationEnabledOpenAIClient': CitationEnabledOpenAIClient,
-            'ReasoningEnabledOpenAIClient': ReasoningEnabledOpenAIClient,
-        }
-        if model_client_cls:
-            agent.register_model_client(
-                model_client_cls=client_class_map[model_client_cls]
-            )
-            # since we are using a hybrid client extending OpenAIClient which just overrides message_retrieval,
-            # after the new client is registered, the custom model_client_cls attribute must be removed
-            # otherwise OpenAIWrapper.create will throw an error because it can't handle model_client_cls
-            agent.client._config_list[0].pop('model_client_cls', None)
+        agent.replace_reply_func(
+            old_reply_func=autogen.ConversableAgent.generate_oai_reply,
+            new_reply_func=generate_oai_reply_with_loading
+            if kwargs.get('show_loading_animation', True)
+            else generate_oai_reply,
+        )
+        agent._openai_model_prefix = get_openai_model_prefix()
+        register_custom_model_client(agent)
         # complex system messages result in lower performance for COT models, with the
         # exception of claude which requires a system message
         if any(name in model_name for name in REASONING_MODELS):
@@ -549,4 +615,5 @@ class AgentFactory:
 
 
 def get_agents_options():
-    return list(get_type_hints(AgentFactoryMap).keys())
+    # annotations are kept as strings, resolving them with get_type_hints would import autogen
+    return list(AgentFactoryMap.__annotations__.keys())
@@ -1,3 +1,4 @@
+from utils import run_in_daemon  # noqa: F401 - must stay the first import
 from agents import custom_agents
 import autogen
 from utils import prompt_utils
@@ -4,18 +4,43 @@
 # in such a way that the reader can easily parse it and extract titles of interest
 # to follow up on, make sure no title from the initial list is excluded
 # then you can ask the agent to follow up on a particular paper you want to go more in depth for
+from utils import run_in_daemon  # noqa: F401 - must stay the first import
 from agents import custom_agents
 from utils import prompt_utils, llm_functions
+from utils.lazy_import import lazy_import
 from autogen import register_function
 from autogen.agentchat.contrib.capabilities import transform_messages
-from autogen.agentchat.contrib.capabilities.text_compressors import LLMLingua
 from autogen.agentchat.contrib.capabilities.transforms import TextMessageCompressor
 import os
 
+# importing llmlingua loads torch and transformers, which takes longer than the whole framework
+text_compressors = lazy_import(
+    'autogen.agentchat.contrib.capabilities.text_compressors'
+)
+
+
+class LazyLLMLingua:
+    """An LLMLingua text compressor which loads its model on the first
+    compression, so that short conversations never pay for it."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.compressor = None
+
+    @prompt_utils.with_progress_bar(description='Loading LLMLingua...')
+    def _load_compressor(self):
+        return text_compressors.LLMLingua(**self.kwargs)
+
+    def compress_text(self, text: str, **compression_params):
+        if self.compressor is None:
+            self.compressor = self._load_compressor()
+        return self.compressor.compress_text(text, **compression_params)
+
+
 # since arxiv workflow parses large prompts, LLMLingua is used for compression
 # don't forget to install the required extra tools via pip install -e '.[text-compression]'
 os.environ['TOKENIZERS_PARALLELISM'] = 'true'
-llm_lingua = LLMLingua()
+llm_lingua = LazyLLMLingua()
 text_compressor = TextMessageCompressor(text_compressor=llm_lingua, min_tokens=500)
 context_handling = transform_messages.TransformMessages(transforms=[text_compressor])
 
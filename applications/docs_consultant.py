@@ -3,10 +3,15 @@
 # the proxy user (manually controlled by the human) forwards questions to
 # the autogen agent who decides if calling llamaindex is required
 # don't forget to install the required extra tools via pip install -e '.[rag]'
+from utils import run_in_daemon  # noqa: F401 - must stay the first import
+import functools
 from agents import custom_agents
 from utils import prompt_utils, file_utils
+from utils.lazy_import import lazy_import
 from autogen import register_function
-from utils import llamaindex
+
+# llama_index is only imported when the first query is made
+llamaindex = lazy_import('utils.llamaindex')
 
 files = [
     {
@@ -25,6 +30,8 @@ to the information which is requested.
 """
 
 
+# the documents are indexed when the assistant decides to query them for the first time
+@functools.lru_cache(maxsize=None)
 @prompt_utils.with_progress_bar(description='Initializing query engine...')
 def get_query_engine():
     return llamaindex.DocumentQueryEngine.get_instance(
@@ -34,11 +41,10 @@ def get_query_engine():
     )
 
 
-query_engine = get_query_engine()
-
 # claude main assistant + openai llamaindex assistant yield good results
 default_llm = custom_agents.Configs.claude_35_sonnet
-assistant, user_proxy = custom_agents.get_agents(
+agents = custom_agents.AgentFactory()
+assistant, user_proxy = agents.get_agents(
     names=['advanced_assistant', 'user_proxy'], overwrite_config=default_llm
 ).values()
 
@@ -50,7 +56,7 @@ custom_llm_to_use = prompt_utils.ask_for_prompt_with_completer(
 
 # re-fetch assistant agent with new config is one is selected
 if custom_llm_to_use:
-    assistant = custom_agents.get_agents(
+    assistant = agents.get_agents(
         names=['advanced_assistant'],
         overwrite_config=getattr(custom_agents.Configs, custom_llm_to_use),
     )['advanced_assistant']
@@ -59,7 +65,7 @@ if custom_llm_to_use:
 # wrapper function was created because passing an instance method
 # like query_engine.query to register_function will result in an error
 def query(question: str) -> str:
-    return query_engine.query(question)
+    return get_query_engine().query(question)
 
 
 register_function(
@@ -1,10 +1,10 @@
+from utils import run_in_daemon  # noqa: F401 - must stay the first import
 import concurrent.futures
 
 from agents import custom_agents
 from utils import prompt_utils
+from utils.lazy_import import lazy_import
 from typing import Annotated
-from autogen.agentchat.group import ContextVariables
-from autogen import register_function, ConversableAgent
 from rich import print
 from rich.table import Table
 from rich.console import Group
@@ -16,6 +16,10 @@ from rich.panel import Panel
 from rich.spinner import Spinner
 from rich.text import Text
 
+# autogen is used only after the first prompt, while waiting for it the import runs in the background
+autogen = lazy_import('autogen')
+group = lazy_import('autogen.agentchat.group')
+
 # relevant resources:
 # https://docs.ag2.ai/docs/user-guide/advanced-concepts/pattern-cookbook/redundant
 # https://docs.ag2.ai/latest/docs/use-cases/notebooks/notebooks/run_and_event_processing/#sequential-run
@@ -101,7 +105,7 @@ assistant_3.silent = True
 
 # Shared context for tracking important conversation attributes and redundant agent
 # results (shared_context not included in the context window but agents can access it)
-shared_context = ContextVariables(
+shared_context = group.ContextVariables(
     data={
         # Process state
         "task_initiated": False,
@@ -174,7 +178,7 @@ redundant_agents = [assistant_1, assistant_2, assistant_3]
 assistant_names = list(map(lambda x: x.name, redundant_agents))
 
 
-def ask_agent(agent: ConversableAgent, task: str):
+def ask_agent(agent: autogen.ConversableAgent, task: str):
     agent_response = agent.run(
         message=task,
         max_turns=1,
@@ -274,7 +278,7 @@ def evaluate_and_select(
     selection_rationale: Annotated[
         str, "Explanation for why this result was selected or how it was synthesized"
     ],
-    context_variables: ContextVariables,
+    context_variables: group.ContextVariables,
 ) -> None:
     """
     Evaluate the different approaches and select or synthesize the best result
@@ -299,14 +303,14 @@ def evaluate_and_select(
     print(f"Evaluation complete. Selected result: {selection_rationale[:100]}...")
 
 
-register_function(
+autogen.register_function(
     caller=taskmaster_agent,
     executor=user_proxy,
     f=ask_agents,
     name="ask_agents",
     description="Initiate processing of a task across multiple redundant agents with different approaches - each task is self contained, and must make sense by itself.",
 )
-register_function(
+autogen.register_function(
     caller=evaluator_agent,
     executor=user_proxy,
     f=evaluate_and_select,
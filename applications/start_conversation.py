@@ -1,4 +1,5 @@
 # a simple 2 way conversation between a human and an AI agent
+from utils import run_in_daemon  # noqa: F401 - must stay the first import
 from agents import custom_agents
 from utils import prompt_utils
 
@@ -1,7 +1,11 @@
 # a group conversation between a human -> an AI agent -> AI critic
+from utils import run_in_daemon  # noqa: F401 - must stay the first import
 from agents import custom_agents
 from utils import prompt_utils
-import autogen
+from utils.lazy_import import lazy_import
+
+# imported in the background while the assistant is selected
+autogen = lazy_import('autogen')
 
 message = """
 """
@@ -0,0 +1,87 @@
+"""Measure the startup cost of the lazily resolved `Configs` registry.
+
+Usage: python benchmarks/startup.py [--runs N]
+
+Reports the time needed to import `agents.custom_agents` (in a fresh interpreter),
+the time spent resolving every `Configs` entry - which is what the import used
+to pay when all entries were built in the class body - and the time spent
+resolving the few entries a typical application uses.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+# the configs used by start_conversation.py with the default coder assistant
+TYPICAL_APP_CONFIGS = ['gpt_41', 'gemini_2_flash']
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+from agents import custom_agents
+print(time.perf_counter() - start)
+"""
+
+
+def measure_import(runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', IMPORT_SNIPPET],
+            cwd=PROJECT_ROOT,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def measure_resolve(custom_agents, names: list[str], runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        for name in names:
+            vars(custom_agents.Configs)[name].invalidate()
+        custom_agents.model_index.get_model_index.cache_clear()
+
+        start = time.perf_counter()
+        for name in names:
+            try:
+                getattr(custom_agents.Configs, name)
+            except ValueError:
+                # the model is not available with the current routing (ex: proxy is down)
+                pass
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def format_ms(timings: list[float]) -> str:
+    return f"{statistics.median(timings) * 1000:8.2f} ms (median of {len(timings)})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from agents import custom_agents
+
+    all_configs = custom_agents.get_config_options()
+    eager = measure_resolve(custom_agents, all_configs, args.runs)
+    typical = measure_resolve(custom_agents, TYPICAL_APP_CONFIGS, args.runs)
+    imports = measure_import(args.runs)
+
+    print(f"import agents.custom_agents (lazy):   {format_ms(imports)}")
+    print(f"resolve all {len(all_configs)} configs (eager):  {format_ms(eager)}")
+    print(
+        f"resolve {len(TYPICAL_APP_CONFIGS)} configs (typical app): {format_ms(typical)}"
+    )
+    saved = statistics.median(eager) - statistics.median(typical)
+    print(f"startup time saved per application:  {saved * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Measure the time to first prompt of the applications.
+
+Usage: python benchmarks/time_to_first_prompt.py [--app NAME] [--runs N] [--top N]
+
+Each application is started in a fresh interpreter which exits as soon as it
+asks for user input (see `prompt_utils.exit_if_profiling_first_prompt`).
+The reported time is the wall clock time between starting the process and the
+first prompt, followed by the slowest imports on that path, as reported by
+`python -X importtime` (with background prefetching disabled, since imports
+running in another thread mess up its nesting).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+APPLICATIONS_DIR = PROJECT_ROOT / 'applications'
+# same as prompt_utils.PROFILE_FIRST_PROMPT_ENV_VAR, not imported to keep this script dependency free
+PROFILE_FIRST_PROMPT_ENV_VAR = 'PROFILE_FIRST_PROMPT'
+RUN_TIMEOUT = 120  # seconds
+
+
+def get_applications(name: Optional[str] = None) -> List[Path]:
+    applications = sorted(
+        path for path in APPLICATIONS_DIR.glob('*.py') if path.name != '__init__.py'
+    )
+    if name:
+        applications = [path for path in applications if path.stem == name]
+        if not applications:
+            raise SystemExit(f"Unknown application: {name}")
+    return applications
+
+
+def run_application(
+    application: Path, importtime: bool = False
+) -> Tuple[float, subprocess.CompletedProcess]:
+    env = {
+        **os.environ,
+        PROFILE_FIRST_PROMPT_ENV_VAR: '1',
+        'PYTHONPATH': str(PROJECT_ROOT),
+    }
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+        env['DISABLE_IMPORT_PREFETCH'] = '1'
+    command.append(str(application))
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        command,
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=RUN_TIMEOUT,
+    )
+    return time.perf_counter() - start, result
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, float]]:
+    """Get the cumulative import time (in seconds) of the top level imports
+    from the `-X importtime` output."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:') :].split('|')
+        # nested imports are indented, only keep the ones imported directly
+        if not name.startswith('  '):
+            imports.append((name.strip(), int(cumulative) / 1e6))
+    return imports
+
+
+def profile_application(application: Path, runs: int, top: int) -> None:
+    timings = []
+    for _ in range(runs):
+        try:
+            elapsed, result = run_application(application)
+        except subprocess.TimeoutExpired:
+            print(f"{application.stem:32} failed: no prompt after {RUN_TIMEOUT}s")
+            return
+        if result.returncode != 0:
+            error = (result.stderr.strip().splitlines() or ['unknown error'])[-1]
+            print(
+                f"{application.stem:32} failed (exit code {result.returncode}): {error}"
+            )
+            return
+        timings.append(elapsed)
+
+    print(
+        f"{application.stem:32} {statistics.median(timings) * 1000:8.0f} ms "
+        f"(median of {runs})"
+    )
+    _, result = run_application(application, importtime=True)
+    slowest = sorted(
+        parse_importtime(result.stderr), key=lambda item: item[1], reverse=True
+    )
+    for name, cumulative in slowest[:top]:
+        print(f"    {cumulative * 1000:8.0f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', help='Profile a single application, ex: chef')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument(
+        '--top', type=int, default=5, help='Number of slowest imports to list'
+    )
+    args = parser.parse_args()
+
+    for application in get_applications(args.app):
+        profile_application(application, args.runs, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import functools
+import logging
+import os
+import pickle
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import yaml
+
+from config import config
+from utils import file_utils
+
+LITELLM_CONFIG_FILE = file_utils.get_project_root() / 'litellm_config.yml'
+METADATA_CACHE_FILE = file_utils.get_project_root() / '.cache' / 'litellm_config.pickle'
+PROVIDER_PREFIXES = [
+    'openai',
+    'openrouter',
+    'anthropic',
+    'google',
+    'mistral',
+    'deepseek',
+    'ollama',
+]
+
+
+@dataclass(frozen=True)
+class ModelInfo:
+    """Compiled information about a single model entry."""
+
+    # model name as used in the autogen config list, ex: openrouter/gpt-5
+    name: str
+    # provider prefix of the model name, empty for models called directly (not through LiteLLM)
+    provider: str
+    # model name without the provider prefix, ex: gpt-5
+    logical_name: str
+    client_cls: Optional[str]
+    price: Optional[Tuple[float, float]]
+    # the autogen config list entry
+    config: Dict[str, Any]
+    # litellm_params of the matching model in litellm_config.yml, if any
+    litellm_params: Dict[str, Any] = field(default_factory=dict)
+
+
+def split_provider(model_name: str) -> Tuple[str, str]:
+    provider, separator, logical_name = model_name.partition('/')
+    if separator and provider in PROVIDER_PREFIXES:
+        return provider, logical_name
+    return '', model_name
+
+
+def load_litellm_metadata(
+    config_file: Path = LITELLM_CONFIG_FILE, cache_file: Path = METADATA_CACHE_FILE
+) -> Dict[str, Dict[str, Any]]:
+    """Load the litellm_params of each model defined in the LiteLLM config.
+
+    The parsed yaml is cached in a binary form next to the autogen cache and
+    invalidated when the modification time or size of the config file changes.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: litellm_params keyed by the LiteLLM model_name.
+    """
+    try:
+        stat = config_file.stat()
+    except OSError:
+        logging.warning(
+            f"LiteLLM config {config_file} not found, no model metadata loaded."
+        )
+        return {}
+    cache_key = (str(config_file), stat.st_mtime_ns, stat.st_size)
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, metadata = pickle.load(f)
+        if cached_key == cache_key:
+            return metadata
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    with open(config_file) as f:
+        model_list = (yaml.safe_load(f) or {}).get('model_list', [])
+    metadata = {
+        model['model_name']: model.get('litellm_params', {}) for model in model_list
+    }
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((cache_key, metadata), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logging.debug(f"Unable to cache the LiteLLM model metadata: {e}")
+    return metadata
+
+
+class ModelIndex:
+    """An in-memory index of the models defined in `config.get_llms_config`.
+
+    Lookups by model name, provider prefix, model client class, logical
+    model name and price are dict accesses on structures compiled once,
+    instead of a linear scan of the config list on every query.
+    """
+
+    def __init__(
+        self,
+        llms_config: List[Dict[str, Any]],
+        litellm_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        litellm_metadata = litellm_metadata or {}
+        self.by_name: Dict[str, ModelInfo] = {}
+        self.by_provider: Dict[str, List[ModelInfo]] = defaultdict(list)
+        self.by_client_cls: Dict[Optional[str], List[ModelInfo]] = defaultdict(list)
+        self.by_logical_name: Dict[str, List[ModelInfo]] = defaultdict(list)
+        self.by_price: Dict[Tuple[float, float], List[ModelInfo]] = defaultdict(list)
+
+        for entry in llms_config:
+            provider, logical_name = split_provider(entry['model'])
+            price = tuple(entry['price']) if entry.get('price') else None
+            info = ModelInfo(
+                name=entry['model'],
+                provider=provider,
+                logical_name=logical_name,
+                client_cls=entry.get('model_client_cls'),
+                price=price,
+                config=entry,
+                litellm_params=litellm_metadata.get(entry['model'], {}),
+            )
+            # first definition wins, same as filtering the config list
+            self.by_name.setdefault(info.name, info)
+            self.by_provider[provider].append(info)
+            self.by_client_cls[info.client_cls].append(info)
+            self.by_logical_name[logical_name].append(info)
+            if price is not None:
+                self.by_price[price].append(info)
+
+        # models with a known price, cheapest (input + output price) first
+        self.price_sorted: List[ModelInfo] = sorted(
+            (info for info in self.by_name.values() if info.price is not None),
+            key=lambda info: sum(info.price),
+        )
+
+    def get(self, model: str) -> Optional[ModelInfo]:
+        return self.by_name.get(model)
+
+    def where(self, model: Union[str, List[str]]) -> List[Dict[str, Any]]:
+        """Get copies of the config list entries of the given model(s).
+
+        Raises:
+            ValueError: If none of the models are defined.
+        """
+        models = [model] if isinstance(model, str) else model
+        config_list = [
+            dict(self.by_name[name].config) for name in models if name in self.by_name
+        ]
+        if not config_list:
+            raise ValueError(
+                f"No config found that satisfies the filter criteria: {{'model': {model!r}}}"
+            )
+        return config_list
+
+
+@functools.lru_cache(maxsize=None)
+def get_model_index() -> ModelIndex:
+    # api keys are never written to disk, so config.py entries are compiled in-process
+    return ModelIndex(config.get_llms_config(), load_litellm_metadata())
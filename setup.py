@@ -50,6 +50,44 @@ class ReviewCommand(CustomCommand):
         )
 
 
+class ProfileStartupCommand(CustomCommand):
+    user_options = [
+        ('app=', 'a', 'Application to profile, all applications by default'),
+        ('runs=', 'r', 'Number of runs per application'),
+    ]
+
+    def initialize_options(self):
+        self.app = None
+        self.runs = None
+
+    def run(self):
+        cmd = ['python', 'benchmarks/time_to_first_prompt.py']
+        if self.app:
+            cmd += ['--app', self.app]
+        if self.runs:
+            cmd += ['--runs', str(self.runs)]
+        check_call(cmd)
+
+
+class StartAgentDaemonCommand(CustomCommand):
+    user_options = [
+        (
+            'preload=',
+            'p',
+            'Comma separated extra modules to preload, ex: utils.llamaindex',
+        )
+    ]
+
+    def initialize_options(self):
+        self.preload = None
+
+    def run(self):
+        cmd = ['python', '-m', 'utils.agent_daemon', 'start']
+        if self.preload:
+            cmd += ['--preload', *self.preload.split(',')]
+        check_call(cmd)
+
+
 class StartLiteLLMServerCommand(CustomCommand):
     def initialize_options(self):
         self.file = None
@@ -257,7 +295,9 @@ setup(
             [['docformatter', '-r', '-i', '.']],
         ),
         review=ReviewCommand,
+        profile_startup=ProfileStartupCommand,
         litellm=StartLiteLLMServerCommand,
+        daemon=StartAgentDaemonCommand,
         ui=StartAutogenStudioCommand,
         clean=CleanupRepo,
     ),
@@ -0,0 +1,323 @@
+"""A long running daemon which keeps the framework warm for the applications.
+
+Start it with `python setup.py daemon` (or `python -m utils.agent_daemon start`).
+While it runs, every application hands its session over to the daemon
+instead of importing autogen, compiling the model index and resolving the
+configs on its own: the daemon forks a pre-initialized copy of itself, which
+runs the application script with the terminal (stdin, stdout and stderr) of
+the thin client, so the session starts in milliseconds.
+
+Restart the daemon after changing the code, the configs or .env.secrets.
+"""
+import argparse
+import importlib
+import io
+import json
+import logging
+import os
+import runpy
+import signal
+import socket
+import sys
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils import file_utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_FILE = file_utils.get_project_root() / '.cache' / 'agent_daemon.sock'
+SOCKET_FILE_ENV_VAR = 'AGENT_DAEMON_SOCKET'
+DISABLE_ENV_VAR = 'DISABLE_AGENT_DAEMON'
+# modules imported before serving any session, on top of the ones used by every application
+DEFAULT_PRELOAD = [
+    'autogen',
+    'autogen.agentchat.contrib.multimodal_conversable_agent',
+    'clients.oai_llama_online',
+    'clients.reasoning_models',
+    'utils.http_utils',
+    'utils.llm_functions',
+]
+# signals received by the thin client which are passed on to the session
+FORWARDED_SIGNALS = [signal.SIGINT, signal.SIGTERM, signal.SIGWINCH]
+
+# True in the forked process running an application, so that it doesn't delegate again
+_in_session = False
+
+
+def get_socket_file() -> Path:
+    return Path(os.environ.get(SOCKET_FILE_ENV_VAR, DEFAULT_SOCKET_FILE))
+
+
+def _send_message(conn: socket.socket, message: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(message).encode() + b'\n')
+
+
+def _send_request(
+    conn: socket.socket, request: Dict[str, Any], fds: Optional[List[int]] = None
+) -> None:
+    # requests start with a single byte carrying the (optional) file descriptors
+    socket.send_fds(conn, [b'\0'], fds or [])
+    _send_message(conn, request)
+
+
+def _connect(socket_file: Path) -> Optional[socket.socket]:
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(socket_file))
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def delegate(app_file: str) -> None:
+    """Run the application in the agent daemon, if one is running.
+
+    Meant to be called at the top of an application script, before any heavy
+    import. When the daemon is not running (or the current process is
+    already a daemon session) this returns right away and the application
+    runs in the current process. Otherwise, the process exits with the exit
+    code of the session once it ends.
+    """
+    if _in_session or os.environ.get(DISABLE_ENV_VAR):
+        return
+    if not hasattr(socket, 'send_fds') or not hasattr(os, 'fork'):
+        return
+    socket_file = get_socket_file()
+    if not socket_file.exists():
+        return
+    conn = _connect(socket_file)
+    if conn is None:
+        # stale socket file left by a daemon which didn't shut down cleanly
+        return
+
+    for stream in (sys.stdout, sys.stderr):
+        stream.flush()
+    # the terminal is shared with the session by passing the file descriptors themselves
+    _send_request(
+        conn,
+        {
+            'command': 'run',
+            'app_file': str(Path(app_file).resolve()),
+            'argv': sys.argv,
+            'cwd': os.getcwd(),
+            'env': dict(os.environ),
+        },
+        fds=[0, 1, 2],
+    )
+
+    responses = conn.makefile('r')
+    session_pid = json.loads(responses.readline())['pid']
+    for signum in FORWARDED_SIGNALS:
+        signal.signal(signum, lambda signum, frame: os.kill(session_pid, signum))
+    line = responses.readline()
+    # no exit code means the session crashed before reporting it
+    sys.exit(json.loads(line)['exit_code'] if line else 1)
+
+
+def _reopen_std_streams() -> None:
+    # the daemon streams point to a log file or a pipe, recreate them for the client terminal
+    for fd, name in enumerate(['stdin', 'stdout', 'stderr']):
+        mode = 'r' if fd == 0 else 'w'
+        line_buffering = fd != 0 and os.isatty(fd)
+        stream = io.TextIOWrapper(
+            io.FileIO(fd, mode + 'b', closefd=False),
+            encoding='utf-8',
+            errors='backslashreplace' if name == 'stderr' else 'strict',
+            line_buffering=line_buffering,
+            write_through=name == 'stderr',
+        )
+        setattr(sys, name, stream)
+        setattr(sys, f'__{name}__', stream)
+
+
+def _refresh_consoles() -> None:
+    # rich detects the terminal capabilities (colors, etc.) when a console is created,
+    # the ones created by the daemon must be re-initialized for the client terminal
+    from rich import get_console
+    from utils import lazy_import, prompt_utils
+
+    consoles = {
+        get_console(),
+        prompt_utils.console,
+        prompt_utils.default_rich_io_stream.console,
+        lazy_import.console,
+    }
+    for console in consoles:
+        console.__init__()
+
+
+def _run_session(conn: socket.socket, fds: List[int], request: Dict[str, Any]) -> int:
+    global _in_session
+    _in_session = True
+    # detach from the daemon session, the client terminal isn't a controlling terminal here
+    os.setsid()
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    for target_fd, fd in enumerate(fds):
+        os.dup2(fd, target_fd)
+        os.close(fd)
+    _reopen_std_streams()
+
+    # same import paths as running the script directly, independent of the working directory
+    sys.path[:] = [os.path.abspath(path) for path in sys.path]
+    sys.path.insert(0, os.path.dirname(request['app_file']))
+    os.chdir(request['cwd'])
+    os.environ.clear()
+    os.environ.update(request['env'])
+    sys.argv = request['argv']
+    _refresh_consoles()
+
+    try:
+        runpy.run_path(request['app_file'], run_name='__main__')
+        exit_code = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            exit_code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except KeyboardInterrupt:
+        exit_code = 130
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    return exit_code
+
+
+class AgentDaemon:
+    """Serves application sessions from a pre-initialized process."""
+
+    def __init__(self, socket_file: Path, preload: List[str]):
+        self.socket_file = socket_file
+        self.preload = preload
+        self.server: Optional[socket.socket] = None
+
+    def warm_up(self) -> None:
+        for module in self.preload:
+            try:
+                importlib.import_module(module)
+            except ImportError as e:
+                logger.warning(f"Unable to preload {module}: {e}")
+
+        from agents import custom_agents
+
+        # installs the IO overrides and waits for autogen
+        custom_agents.AgentFactory()
+        # compiles the model index and caches the LiteLLM proxy state
+        for name in custom_agents.get_config_options():
+            try:
+                getattr(custom_agents.Configs, name)
+            except ValueError:
+                # the model is not available with the current routing (ex: proxy is down)
+                pass
+
+    def serve_forever(self) -> None:
+        existing_conn = _connect(self.socket_file)
+        if existing_conn is not None:
+            existing_conn.close()
+            raise SystemExit(f"Agent daemon already running on {self.socket_file}")
+        self.socket_file.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_file.unlink(missing_ok=True)
+
+        self.warm_up()
+
+        self.server = server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # sessions run arbitrary applications, only the current user may connect
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(str(self.socket_file))
+        finally:
+            os.umask(previous_umask)
+        server.listen()
+        # finished sessions are reaped automatically
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        print(f"Agent daemon listening on {self.socket_file}", flush=True)
+
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    if not self.handle(conn):
+                        break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            self.socket_file.unlink(missing_ok=True)
+
+    def handle(self, conn: socket.socket) -> bool:
+        """Handle a client request.
+
+        Returns:
+            bool: False if the daemon was asked to stop.
+        """
+        try:
+            _, fds, _, _ = socket.recv_fds(conn, 1, 3)
+            request = json.loads(conn.makefile('r').readline())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Invalid request: {e}")
+            return True
+
+        if request['command'] == 'stop':
+            _send_message(conn, {'stopping': True})
+            return False
+        if request['command'] != 'run' or len(fds) != 3:
+            logger.warning(f"Invalid request: {request['command']}")
+            for fd in fds:
+                os.close(fd)
+            return True
+
+        for stream in (sys.stdout, sys.stderr):
+            stream.flush()
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self.server.close()
+                _send_message(conn, {'pid': os.getpid()})
+                exit_code = _run_session(conn, fds, request)
+                sys.stdout.flush()
+                sys.stderr.flush()
+                _send_message(conn, {'exit_code': exit_code})
+            finally:
+                os._exit(exit_code)
+
+        for fd in fds:
+            os.close(fd)
+        return True
+
+
+def stop(socket_file: Path) -> bool:
+    conn = _connect(socket_file)
+    if conn is None:
+        return False
+    with conn:
+        _send_request(conn, {'command': 'stop'})
+        conn.makefile('r').readline()
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['start', 'stop'])
+    parser.add_argument('--socket', type=Path, default=get_socket_file())
+    parser.add_argument(
+        '--preload',
+        nargs='*',
+        default=[],
+        help='Extra modules to import before serving sessions, ex: utils.llamaindex',
+    )
+    args = parser.parse_args()
+
+    if args.command == 'start':
+        AgentDaemon(args.socket, DEFAULT_PRELOAD + args.preload).serve_forever()
+    elif not stop(args.socket):
+        raise SystemExit(f"No agent daemon running on {args.socket}")
+
+
+if __name__ == "__main__":
+    main()
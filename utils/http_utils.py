@@ -2,11 +2,11 @@ import requests
 import arxiv
 import re
 import time
-from typing import Dict, Optional, List, Union
+from typing import Dict, Optional, List, Tuple, Union
 from io import BytesIO
 from pypdf import PdfReader
 from datetime import datetime, timedelta
-from requests.exceptions import ConnectionError
+from requests.exceptions import ConnectionError, Timeout
 import logging
 
 logging.basicConfig(level=logging.WARNING)
@@ -248,31 +248,42 @@ def get_dad_jokes(search_term: str, page: int = 1, limit: int = 10) -> str:
         return f"Failed to fetch jokes, status code: {response.status_code}"
 
 
-def is_litellm_server_running():
+def is_litellm_server_running(
+    base_url: str = 'http://localhost:30000',
+    timeout: Optional[Union[float, Tuple[float, float]]] = None,
+    verbose: bool = True,
+):
     path = '/routes'
 
+    def log(message):
+        if verbose:
+            print(message)
+
     try:
-        response = requests.get(url=f'http://localhost:30000{path}')
+        response = requests.get(url=f'{base_url}{path}', timeout=timeout)
     except ConnectionError:
-        print(
+        log(
             "\nLiteLLM server is not started. If you want to monitor costs, make sure to boot it up.\n"
         )
         return False
+    except Timeout:
+        log(f"LiteLLM server did not answer the {path} request in time")
+        return False
 
     if response.status_code != 200:
-        print("LiteLLM server was not started correctly")
+        log("LiteLLM server was not started correctly")
         return False
 
     try:
         data = response.json()
     except ValueError:
-        print(
+        log(
             f"The response of the {path} request is not a valid JSON. LiteLLM might not be started correctly."
         )
         return False
 
     if 'routes' not in data or not isinstance(data['routes'], list):
-        print(
+        log(
             f"Failed to validate {path} response: it does not contain a 'routes' key or it's not a list."
         )
         return False
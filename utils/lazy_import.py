@@ -0,0 +1,116 @@
+import importlib
+import logging
+import os
+import sys
+import threading
+import types
+from typing import Optional
+
+from rich.console import Console
+
+logger = logging.getLogger(__name__)
+console = Console()
+
+
+class LazyModule(types.ModuleType):
+    """A placeholder for a module which is imported on first attribute
+    access.
+
+    Heavy dependencies (autogen, llama_index, LLMLingua etc.) can be bound
+    at module level without paying their import cost until a feature
+    actually uses them. An optional status message is displayed while the
+    import runs, since it might take a few seconds.
+    """
+
+    def __init__(self, name: str, status: Optional[str] = None):
+        super().__init__(name)
+        self._lazy_status = status
+        self._lazy_module: Optional[types.ModuleType] = None
+        self._lazy_lock = threading.RLock()
+
+    def _load(self) -> types.ModuleType:
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                show_status = (
+                    self._lazy_status is not None
+                    and not is_imported(self.__name__)
+                    and threading.current_thread() is threading.main_thread()
+                )
+                if show_status:
+                    with console.status(self._lazy_status, spinner="dots"):
+                        self._lazy_module = importlib.import_module(self.__name__)
+                else:
+                    self._lazy_module = importlib.import_module(self.__name__)
+            return self._lazy_module
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._lazy_module is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str, status: Optional[str] = None) -> types.ModuleType:
+    """Get a module which is imported only when one of its attributes is
+    accessed.
+
+    Args:
+        name (str): The absolute name of the module, ex: autogen.io.base
+        status (str, optional): Message displayed while the module is imported.
+
+    Returns:
+        types.ModuleType: The module itself if it was already imported, a LazyModule otherwise.
+    """
+    if is_imported(name):
+        return sys.modules[name]
+    return LazyModule(name, status)
+
+
+def is_imported(name: str) -> bool:
+    """Check if a module is fully imported, not only being imported by
+    another thread."""
+    module = sys.modules.get(name)
+    spec = getattr(module, '__spec__', None)
+    return module is not None and not getattr(spec, '_initializing', False)
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    return not isinstance(module, LazyModule) or module._lazy_module is not None
+
+
+def load(module: types.ModuleType) -> types.ModuleType:
+    """Import a lazy module now, returning the actual module."""
+    return module._load() if isinstance(module, LazyModule) else module
+
+
+def _import_modules(names) -> None:
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            # the import is retried (and the error surfaced) when the module is used
+            logger.debug(f"Prefetching {name} failed: {e}")
+
+
+def prefetch(*names: str) -> Optional[threading.Thread]:
+    """Import modules in a background thread.
+
+    Applications usually wait for user input (agent selection, the initial
+    prompt) before using any heavy dependency, so importing them while the
+    user is typing hides most of their import time. A lazy module accessed
+    before its prefetch finished simply waits for the import in progress.
+
+    Prefetching is skipped when the DISABLE_IMPORT_PREFETCH env var is set,
+    ex: to get an accurate `python -X importtime` breakdown of the main thread.
+    """
+    if os.environ.get('DISABLE_IMPORT_PREFETCH'):
+        return None
+    thread = threading.Thread(
+        target=_import_modules, args=(names,), name='lazy-import-prefetch', daemon=True
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,144 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from utils import file_utils
+from utils.lazy_import import lazy_import
+
+# http_utils imports requests, arxiv and pypdf, only needed once the proxy is actually probed
+http_utils = lazy_import('utils.http_utils')
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROXY_URL = 'http://localhost:30000'
+# (connect, read) timeouts - the proxy runs locally, so a healthy one answers almost instantly
+DEFAULT_PROBE_TIMEOUT = (0.25, 1.0)
+DEFAULT_CACHE_TTL = 60  # seconds
+DEFAULT_REPROBE_INTERVAL = 30  # seconds
+DEFAULT_CACHE_FILE = file_utils.get_project_root() / '.cache' / 'litellm_probe.json'
+
+
+class LiteLLMProbe:
+    """Detects whether the LiteLLM proxy server is running without blocking
+    startup.
+
+    The last probe result is cached on disk for `cache_ttl` seconds so that
+    consecutive application runs don't pay for a network round trip. Once
+    the state is known, a daemon thread re-probes the proxy every
+    `reprobe_interval` seconds and notifies the registered listeners when
+    the proxy goes up or down, which allows switching between proxy and
+    direct routing mid-session.
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_PROXY_URL,
+        timeout=DEFAULT_PROBE_TIMEOUT,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        reprobe_interval: float = DEFAULT_REPROBE_INTERVAL,
+        cache_file: Path = DEFAULT_CACHE_FILE,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.reprobe_interval = reprobe_interval
+        self.cache_file = Path(cache_file)
+        self._is_running: Optional[bool] = None
+        self._listeners: List[Callable[[bool], None]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def is_running(self) -> bool:
+        """Get the last known proxy state, probing it only if no fresh
+        result is available."""
+        if self._is_running is None:
+            with self._lock:
+                if self._is_running is None:
+                    cached = self._read_cache()
+                    self._is_running = (
+                        cached if cached is not None else self._probe(verbose=True)
+                    )
+        self._ensure_background_probe()
+        return self._is_running
+
+    def probe(self) -> bool:
+        """Probe the proxy now and notify listeners if its state changed."""
+        is_running = self._probe(verbose=False)
+        previous, self._is_running = self._is_running, is_running
+        if previous is not None and previous != is_running:
+            logger.warning(
+                f"LiteLLM proxy is {'up' if is_running else 'down'}, "
+                f"routing openai models {'through the proxy' if is_running else 'directly'}."
+            )
+            for listener in list(self._listeners):
+                listener(is_running)
+        return is_running
+
+    def add_listener(self, listener: Callable[[bool], None]) -> None:
+        """Register a callback invoked with the new state when it changes."""
+        self._listeners.append(listener)
+
+    def _probe(self, verbose: bool) -> bool:
+        is_running = http_utils.is_litellm_server_running(
+            base_url=self.url, timeout=self.timeout, verbose=verbose
+        )
+        self._write_cache(is_running)
+        return is_running
+
+    def _after_fork(self) -> None:
+        # a forked process (ex: an agent daemon session) might outlive the state it inherited,
+        # read it again from the cache file, which is kept fresh by the parent's re-probe loop
+        self._is_running = None
+        self._lock = threading.Lock()
+
+    def _ensure_background_probe(self) -> None:
+        # threads don't survive a fork, so is_alive() is also False in forked children
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._reprobe_loop, name='litellm-probe', daemon=True
+        )
+        self._thread.start()
+
+    def _reprobe_loop(self) -> None:
+        while True:
+            time.sleep(self.reprobe_interval)
+            try:
+                self.probe()
+            except Exception as e:
+                logger.debug(f"LiteLLM proxy probe failed: {e}")
+
+    def _read_cache(self) -> Optional[bool]:
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get('url') != self.url:
+            return None
+        if time.time() - data.get('checked_at', 0) > self.cache_ttl:
+            return None
+        return bool(data.get('is_running'))
+
+    def _write_cache(self, is_running: bool) -> None:
+        data = {'url': self.url, 'is_running': is_running, 'checked_at': time.time()}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # write + rename so concurrent applications never read a partial file
+            tmp_file = self.cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_text(json.dumps(data))
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logger.debug(f"Unable to cache the LiteLLM proxy state: {e}")
+
+
+default_probe = LiteLLMProbe()
+
+
+def is_litellm_proxy_running() -> bool:
+    return default_probe.is_running()
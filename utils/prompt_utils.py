@@ -1,4 +1,6 @@
 import re
+import os
+import sys
 import builtins
 from pygments.lexers import guess_lexer
 from pygments.lexers.python import PythonLexer
@@ -22,10 +24,13 @@ from rich.progress import (
     SpinnerColumn,
 )
 
-from autogen.io.base import IOStream
-from autogen.events.agent_events import TextEvent
 from typing import List, Tuple, Any
 from enum import Enum
+from utils.lazy_import import lazy_import
+
+# importing any autogen module loads the whole framework, defer it until a conversation starts
+autogen_io = lazy_import('autogen.io.base')
+agent_events = lazy_import('autogen.events.agent_events')
 
 line_separator = "\n" + "-" * 80
 console = Console()
@@ -75,6 +80,15 @@ class OptionCompleter(Completer):
                 yield Completion(option, start_position=-len(text))
 
 
+# set by benchmarks/time_to_first_prompt.py to stop applications as soon as they wait for input
+PROFILE_FIRST_PROMPT_ENV_VAR = 'PROFILE_FIRST_PROMPT'
+
+
+def exit_if_profiling_first_prompt():
+    if os.environ.get(PROFILE_FIRST_PROMPT_ENV_VAR):
+        sys.exit(0)
+
+
 def ask_for_prompt_input(
     prompt='Please input user prompt.',
 ):
@@ -85,6 +99,7 @@ def ask_for_prompt_input(
     - mouse_support=True has a side effect that actions like scroll, select text
     from the terminal require keeping the Fn key pressed.
     """
+    exit_if_profiling_first_prompt()
     prompt_suffix = 'Submit prompt via (Meta|Esc)+Enter.'
     original = 'Press enter to skip and use auto-reply'
     formatted = (
@@ -256,14 +271,18 @@ def format_agent_conversation_header(sender, receiver, sender_color='#D9E805'):
     )
 
 
-class RichIOStream(IOStream):
+# autogen only requires the IOStreamProtocol interface, subclassing IOStream would import autogen
+class RichIOStream:
     def __init__(self):
         self.console = Console()
 
     def send(self, original_message: Any) -> None:
         # for most messages we want to display the preset message models except for conversable_agent._print_received_message
         # where we want to beautify the terminal output
-        if isinstance(original_message, TextEvent) and original_message.type == 'text':
+        if (
+            isinstance(original_message, agent_events.TextEvent)
+            and original_message.type == 'text'
+        ):
             message_content = original_message.content
             message = getattr(message_content, 'content')
             sender_name = getattr(message_content, 'sender')
@@ -294,7 +313,7 @@ default_rich_io_stream = RichIOStream()
 
 
 def set_custom_IO_overrides():
-    IOStream.set_global_default(default_rich_io_stream)
+    autogen_io.IOStream.set_global_default(default_rich_io_stream)
 
 
 # Custom rich print function that should handle ANSI escape sequences correctly
@@ -368,6 +387,7 @@ def ask_for_prompt_with_completer(
     Returns:
         The selected option if valid, otherwise prints an error message.
     """
+    exit_if_profiling_first_prompt()
     kb = KeyBindings()
 
     @kb.add(Keys.Backspace)
@@ -0,0 +1,12 @@
+"""Importing this module first thing in an application script hands the
+whole session over to the agent daemon, if it's running.
+
+See utils.agent_daemon for more details.
+"""
+import sys
+
+from utils import agent_daemon
+
+app_file = getattr(sys.modules['__main__'], '__file__', None)
+if app_file:
+    agent_daemon.delegate(app_file)